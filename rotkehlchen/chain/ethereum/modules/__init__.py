@@ -1,3 +1,6 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __all__ = [
     'Aave',
     'Balancer',
@@ -15,17 +18,47 @@ __all__ = [
     'Nfts',
 ]
 
-from .aave.aave import Aave
-from .balancer.balancer import Balancer
-from .compound import Compound
-from .eth2.eth2 import Eth2
-from .l2.loopring import Loopring
-from .liquity.trove import Liquity
-from .makerdao.dsr import MakerdaoDsr
-from .makerdao.vaults import MakerdaoVaults
-from .nft.nfts import Nfts
-from .pickle_finance import PickleFinance
-from .sushiswap.sushiswap import Sushiswap
-from .uniswap.uniswap import Uniswap
-from .yearn.vaults import YearnVaults
-from .yearn.vaultsv2 import YearnVaultsV2
+if TYPE_CHECKING:
+    from .aave.aave import Aave
+    from .balancer.balancer import Balancer
+    from .compound import Compound
+    from .eth2.eth2 import Eth2
+    from .l2.loopring import Loopring
+    from .liquity.trove import Liquity
+    from .makerdao.dsr import MakerdaoDsr
+    from .makerdao.vaults import MakerdaoVaults
+    from .nft.nfts import Nfts
+    from .pickle_finance import PickleFinance
+    from .sushiswap.sushiswap import Sushiswap
+    from .uniswap.uniswap import Uniswap
+    from .yearn.vaults import YearnVaults
+    from .yearn.vaultsv2 import YearnVaultsV2
+
+# The modules are imported only when first accessed so that importing any single
+# submodule (e.g. some constants) does not pull in every protocol implementation
+_LAZY_MODULES = {
+    'Aave': '.aave.aave',
+    'Balancer': '.balancer.balancer',
+    'Compound': '.compound',
+    'Eth2': '.eth2.eth2',
+    'Loopring': '.l2.loopring',
+    'Liquity': '.liquity.trove',
+    'MakerdaoDsr': '.makerdao.dsr',
+    'MakerdaoVaults': '.makerdao.vaults',
+    'Nfts': '.nft.nfts',
+    'PickleFinance': '.pickle_finance',
+    'Sushiswap': '.sushiswap.sushiswap',
+    'Uniswap': '.uniswap.uniswap',
+    'YearnVaults': '.yearn.vaults',
+    'YearnVaultsV2': '.yearn.vaultsv2',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,6 +1,7 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
+
+import gevent
 
-from rotkehlchen.assets.asset import EvmToken
 from rotkehlchen.chain.ethereum.modules.makerdao.constants import (
     UNIQUE_TOKENS_COLLATERAL_TYPES_MAPPING,
 )
@@ -9,13 +10,16 @@ from rotkehlchen.chain.evm.types import string_to_evm_address
 from rotkehlchen.constants.assets import A_DAI, A_WETH
 from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.types import ChainID, ChecksumEvmAddress
+from rotkehlchen.utils.misc import get_chunks
 
 if TYPE_CHECKING:
     from rotkehlchen.db.dbhandler import DBHandler
 
     from .node_inquirer import EthereumInquirer
 
-ETH_TOKEN_EXCEPTIONS = [
+MAX_CONCURRENT_PROXIES_DETECTION = 8
+
+ETH_TOKEN_EXCEPTIONS = (
     # Ignore the veCRV balance in token query. It's already detected by
     # defi SDK as part of locked CRV in Vote Escrowed CRV. Which is the right way
     # to approach it as there is no way to assign a price to 1 veCRV. It
@@ -35,7 +39,7 @@ ETH_TOKEN_EXCEPTIONS = [
     #
     # Old contract of Fetch.ai
     string_to_evm_address('0x1D287CC25dAD7cCaF76a26bc660c5F7C8E2a05BD'),
-]
+)
 
 
 class EthereumTokens(EvmTokens):
@@ -64,23 +68,43 @@ class EthereumTokens(EvmTokens):
         )
 
     # -- methods that need to be implemented per chain
-    def _get_token_exceptions(self) -> list[ChecksumEvmAddress]:
-        exceptions = ETH_TOKEN_EXCEPTIONS.copy()
-        with self.db.conn.read_ctx() as cursor:
-            ignored_assets = self.db.get_ignored_assets(cursor=cursor)
-
-        # TODO: Shouldn't this query be filtered in the DB?
-        for asset in ignored_assets:  # don't query for the ignored tokens
-            if asset.is_evm_token() and asset.resolve_to_evm_token().chain_id == ChainID.ETHEREUM:
-                exceptions.append(EvmToken(asset.identifier).evm_address)
-
-        return exceptions
+    def _per_chain_token_exceptions(self) -> Sequence[ChecksumEvmAddress]:  # pylint: disable=no-self-use  # noqa: E501
+        return ETH_TOKEN_EXCEPTIONS
 
     def maybe_detect_proxies_tokens(self, addresses: list[ChecksumEvmAddress]) -> None:
-        """Detect tokens for proxies that are owned by the given addresses"""
+        """Detect tokens for proxies that are owned by the given addresses
+
+        May raise:
+        - RemoteError if an external service such as Etherscan is queried and
+          there is a problem with its query.
+        - BadFunctionCallOutput if a local node is used and the contract for the
+          token has no code. That means the chain is not synced
+        """
         proxies_mapping = self.evm_inquirer.proxies_inquirer.get_accounts_having_proxy()
-        proxies_to_use = {k: v for k, v in proxies_mapping.items() if k in addresses}
-        self._detect_tokens(
-            addresses=list(proxies_to_use.values()),
-            tokens_to_check=self.tokens_for_proxies,
-        )
+        addresses_set = set(addresses)
+        proxies_to_use = {k: v for k, v in proxies_mapping.items() if k in addresses_set}
+        proxy_addresses = list(set(proxies_to_use.values()))
+        if len(proxy_addresses) <= 1 or self.evm_inquirer.connected_to_any_web3() is False:
+            # Etherscan is rate limited so concurrent queries would only make it back off
+            self._detect_tokens(
+                addresses=proxy_addresses,
+                tokens_to_check=self.tokens_for_proxies,
+            )
+            return
+
+        # With web3 nodes the detection is dominated by remote calls so overlap them
+        for chunk in get_chunks(proxy_addresses, n=MAX_CONCURRENT_PROXIES_DETECTION):
+            greenlets = [
+                self.evm_inquirer.greenlet_manager.spawn_and_track(
+                    after_seconds=None,
+                    task_name=f'Detect tokens of proxy {proxy_address}',
+                    exception_is_error=False,  # the exception is re-raised to the caller
+                    method=self._detect_tokens,
+                    addresses=[proxy_address],
+                    tokens_to_check=self.tokens_for_proxies,
+                ) for proxy_address in chunk
+            ]
+            try:
+                gevent.joinall(greenlets, raise_error=True)
+            finally:  # on error, don't let the other detections keep writing to the DB
+                gevent.killall(greenlets)
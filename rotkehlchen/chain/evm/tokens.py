@@ -363,12 +363,32 @@ class EvmTokens(metaclass=ABCMeta):
 
         return addresses_to_balances, token_usd_price
 
+    def _get_token_exceptions(self) -> Sequence[ChecksumEvmAddress]:
+        """
+        Returns the token addresses that will not be taken into account
+        when performing token detection. Those are the chain-specific exceptions
+        and the user's ignored tokens of the chain.
+        """
+        with self.db.conn.read_ctx() as cursor:
+            ignored_asset_ids = self.db.get_ignored_asset_ids(cursor=cursor)
+
+        # don't query for the ignored tokens
+        ignored_addresses = GlobalDBHandler().get_evm_token_addresses(
+            identifiers=ignored_asset_ids,
+            chain_id=self.evm_inquirer.chain_id,
+        )
+        chain_exceptions = self._per_chain_token_exceptions()
+        if len(ignored_addresses) == 0:  # common case. Avoid copying the chain exceptions
+            return chain_exceptions
+
+        return [*chain_exceptions, *ignored_addresses]
+
     # -- methods to be implemented by child classes
     @abstractmethod
-    def _get_token_exceptions(self) -> list[ChecksumEvmAddress]:
+    def _per_chain_token_exceptions(self) -> Sequence[ChecksumEvmAddress]:
         """
-        Returns a list of token addresses that will not be taken into account
-        when performing token detection.
+        Returns the token addresses that will not be taken into account
+        when performing token detection, on top of the ignored tokens.
 
         Each chain needs to implement any chain-specific exceptions here.
         """
@@ -718,6 +718,12 @@ class DBHandler:
 
         return assets
 
+    # pylint: disable=no-self-use
+    def get_ignored_asset_ids(self, cursor: 'DBCursor') -> set[str]:
+        """Retrieve the identifiers of all ignored assets without resolving them"""
+        cursor.execute('SELECT value FROM multisettings WHERE name="ignored_asset";')
+        return {entry[0] for entry in cursor}
+
     def add_to_ignored_action_ids(
             self,
             write_cursor: 'DBCursor',
@@ -4,7 +4,18 @@ import shutil
 import sqlite3
 from collections import defaultdict
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Iterable, Literal, Optional, Union, cast, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Collection,
+    Iterable,
+    Literal,
+    Optional,
+    Sequence,
+    Union,
+    cast,
+    overload,
+)
 
 from rotkehlchen.assets.asset import (
     Asset,
@@ -830,7 +841,7 @@ class GlobalDBHandler():
     @staticmethod
     def get_evm_tokens(
             chain_id: ChainID,
-            exceptions: Optional[list[ChecksumEvmAddress]] = None,
+            exceptions: Optional[Sequence[ChecksumEvmAddress]] = None,
             protocol: Optional[str] = None,
     ) -> list[EvmToken]:
         """Gets all ethereum tokens from the DB
@@ -880,6 +891,24 @@ class GlobalDBHandler():
 
         return tokens
 
+    @staticmethod
+    def get_evm_token_addresses(
+            identifiers: Collection[str],
+            chain_id: ChainID,
+    ) -> list[ChecksumEvmAddress]:
+        """Gets the addresses of the evm tokens of the given chain whose identifier
+        is in the provided identifiers. Identifiers of other assets are skipped."""
+        if len(identifiers) == 0:
+            return []
+
+        questionmarks = ','.join('?' * len(identifiers))
+        with GlobalDBHandler().conn.read_ctx() as cursor:
+            cursor.execute(
+                f'SELECT address FROM evm_tokens WHERE chain=? AND identifier IN ({questionmarks});',  # noqa: E501
+                (chain_id.serialize_for_db(), *identifiers),
+            )
+            return [string_to_evm_address(entry[0]) for entry in cursor]
+
     @staticmethod
     def get_tokens_mappings(addresses: list[ChecksumEvmAddress]) -> dict[ChecksumEvmAddress, str]:  # noqa: E501
         """Gets mappings: address -> name for tokens whose address is in the provided list"""
@@ -1,6 +1,12 @@
+import subprocess
+import sys
+
 import pytest
 
 from rotkehlchen.chain.aggregator import _module_name_to_class
+from rotkehlchen.chain.ethereum import modules
+from rotkehlchen.chain.ethereum.modules import Aave
+from rotkehlchen.chain.ethereum.modules.aave.aave import Aave as AaveModule
 from rotkehlchen.types import AVAILABLE_MODULES_MAP
 
 
@@ -20,3 +26,23 @@ def test_module_deactivation(blockchain):
         assert isinstance(blockchain.eth_modules[module_name], expected_module_type)
         blockchain.deactivate_module(module_name)
         assert module_name not in blockchain.eth_modules
+
+
+def test_ethereum_modules_lazy_imports():
+    """Check that the ethereum modules package only imports a protocol module when
+    its class is accessed"""
+    assert Aave is AaveModule
+    with pytest.raises(AttributeError):
+        modules.NotAModule  # pylint: disable=pointless-statement
+
+    # run in a new interpreter since the modules are already imported by the test suite
+    subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            'import sys\n'
+            'import rotkehlchen.chain.ethereum.modules.makerdao.constants\n'
+            "assert 'rotkehlchen.chain.ethereum.modules.aave.aave' not in sys.modules\n",
+        ],
+        check=True,
+    )
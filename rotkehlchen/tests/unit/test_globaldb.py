@@ -11,7 +11,7 @@ from rotkehlchen.assets.resolver import AssetResolver
 from rotkehlchen.assets.types import AssetData, AssetType
 from rotkehlchen.assets.utils import get_or_create_evm_token, symbol_to_asset_or_token
 from rotkehlchen.chain.evm.types import string_to_evm_address
-from rotkehlchen.constants.assets import A_BAT, A_CRV, A_DAI, A_ETH, A_LUSD, A_PICKLE, A_USD
+from rotkehlchen.constants.assets import A_BAT, A_CRV, A_DAI, A_ETH, A_LUSD, A_OP, A_PICKLE, A_USD
 from rotkehlchen.constants.misc import NFT_DIRECTIVE, ONE
 from rotkehlchen.constants.resolver import ethaddress_to_identifier
 from rotkehlchen.db.custom_assets import DBCustomAssets
@@ -1169,3 +1169,17 @@ def test_get_assets_missing_information_by_symbol(globaldb):
     assets = globaldb.get_assets_with_symbol('BPTTT')
     assert len(assets) == 1
     assert assets[0].name == 'Test token'
+
+
+def test_get_evm_token_addresses(globaldb):
+    """Check that only the tokens of the given chain are returned"""
+    identifiers = ['unknown-asset', A_DAI.identifier, A_OP.identifier, A_ETH.identifier]
+    assert globaldb.get_evm_token_addresses(
+        identifiers=identifiers,
+        chain_id=ChainID.ETHEREUM,
+    ) == [A_DAI.resolve_to_evm_token().evm_address]
+    assert globaldb.get_evm_token_addresses(
+        identifiers=identifiers,
+        chain_id=ChainID.OPTIMISM,
+    ) == [A_OP.resolve_to_evm_token().evm_address]
+    assert globaldb.get_evm_token_addresses(identifiers=[], chain_id=ChainID.ETHEREUM) == []
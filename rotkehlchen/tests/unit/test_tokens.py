@@ -1,16 +1,19 @@
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+import gevent
 import pytest
 from flaky import flaky
 
-from rotkehlchen.chain.ethereum.tokens import EthereumTokens
+from rotkehlchen.chain.ethereum.tokens import ETH_TOKEN_EXCEPTIONS, EthereumTokens
 from rotkehlchen.chain.evm.tokens import generate_multicall_chunks
 from rotkehlchen.chain.evm.types import string_to_evm_address
-from rotkehlchen.constants.assets import A_OMG, A_WETH
+from rotkehlchen.constants.assets import A_BTC, A_OMG, A_OP, A_WETH
+from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.fval import FVal
 from rotkehlchen.tests.utils.constants import A_LPT
-from rotkehlchen.types import ChainID
+from rotkehlchen.tests.utils.factories import make_evm_address
+from rotkehlchen.types import ChainID, SupportedBlockchain
 from rotkehlchen.utils.misc import ts_now
 
 
@@ -139,3 +142,103 @@ def test_last_queried_ts(tokens, freezer):
         assert len(after_second_query) == 1
         assert after_second_query[0][0] == 'last_queried_timestamp'
         assert int(after_second_query[0][1]) >= continuation
+
+
+@pytest.mark.parametrize('ignored_assets', [[A_LPT, A_BTC, A_OP]])
+def test_token_exceptions(tokens):
+    """Check that only ethereum tokens from the ignored assets are added to the exceptions"""
+    exceptions = tokens._get_token_exceptions()
+    assert exceptions == [*ETH_TOKEN_EXCEPTIONS, A_LPT.resolve_to_evm_token().evm_address]
+    assert A_OP.resolve_to_evm_token().evm_address not in exceptions, 'optimism token should be skipped'  # noqa: E501
+
+
+@pytest.mark.parametrize('ignored_assets', [[A_BTC, A_OP]])
+def test_token_exceptions_no_ignored_tokens(tokens):
+    """Check that without ignored ethereum tokens only the base exceptions are returned"""
+    assert tokens._get_token_exceptions() == ETH_TOKEN_EXCEPTIONS
+
+
+def test_detect_tokens_for_multiple_proxies(tokens):
+    """Check that tokens of multiple proxies are detected concurrently and saved for each proxy"""
+    owner1, owner2, owner3 = make_evm_address(), make_evm_address(), make_evm_address()
+    proxy1, proxy2, proxy3 = make_evm_address(), make_evm_address(), make_evm_address()
+    weth = A_WETH.resolve_to_evm_token()
+    running, max_running = 0, 0
+
+    def mock_query_chunks(address, **kwargs):  # pylint: disable=unused-argument
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        gevent.sleep(0.1)  # yield so that the other detection can start
+        running -= 1
+        return {weth: FVal(1)}
+
+    with patch.object(
+        tokens.evm_inquirer.proxies_inquirer,
+        'get_accounts_having_proxy',
+        return_value={owner1: proxy1, owner2: proxy2, owner3: proxy3},
+    ), patch.object(
+        tokens.evm_inquirer,
+        'connected_to_any_web3',
+        return_value=True,
+    ), patch.object(
+        tokens,
+        '_query_chunks',
+        side_effect=mock_query_chunks,
+    ) as query_chunks:
+        tokens.maybe_detect_proxies_tokens([owner1, owner2])
+
+    assert query_chunks.call_count == 2
+    assert max_running == 2, 'both detections should be in flight at the same time'
+    assert {x.kwargs['address'] for x in query_chunks.call_args_list} == {proxy1, proxy2}
+    with tokens.db.conn.read_ctx() as cursor:
+        for proxy in (proxy1, proxy2):
+            saved_tokens, _ = tokens.db.get_tokens_for_address(
+                cursor=cursor,
+                address=proxy,
+                blockchain=SupportedBlockchain.ETHEREUM,
+            )
+            assert saved_tokens == [weth]
+        assert tokens.db.get_tokens_for_address(
+            cursor=cursor,
+            address=proxy3,
+            blockchain=SupportedBlockchain.ETHEREUM,
+        ) == (None, None), 'proxy of a non given address should not be detected'
+
+
+def test_detect_tokens_for_multiple_proxies_error(tokens):
+    """Check that if the detection of a proxy fails the error is raised and
+    the rest of the concurrent detections are stopped"""
+    owner1, owner2 = make_evm_address(), make_evm_address()
+    proxy1, proxy2 = make_evm_address(), make_evm_address()
+    weth = A_WETH.resolve_to_evm_token()
+
+    def mock_query_chunks(address, **kwargs):  # pylint: disable=unused-argument
+        if address == proxy2:
+            raise RemoteError('Failed to query proxy tokens')
+        gevent.sleep(0.1)  # still running when the other detection fails
+        return {weth: FVal(1)}
+
+    with patch.object(
+        tokens.evm_inquirer.proxies_inquirer,
+        'get_accounts_having_proxy',
+        return_value={owner1: proxy1, owner2: proxy2},
+    ), patch.object(
+        tokens.evm_inquirer,
+        'connected_to_any_web3',
+        return_value=True,
+    ), patch.object(
+        tokens,
+        '_query_chunks',
+        side_effect=mock_query_chunks,
+    ), pytest.raises(RemoteError):
+        tokens.maybe_detect_proxies_tokens([owner1, owner2])
+
+    gevent.sleep(0.2)  # give time to a detection that was not stopped to finish
+    with tokens.db.conn.read_ctx() as cursor:
+        for proxy in (proxy1, proxy2):
+            assert tokens.db.get_tokens_for_address(
+                cursor=cursor,
+                address=proxy,
+                blockchain=SupportedBlockchain.ETHEREUM,
+            ) == (None, None)